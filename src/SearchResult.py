@@ -24,9 +24,28 @@ from typing import Dict, Any
 from Settings import Settings
 
 
+# The display lengths are bound to module-level names, so they don't have to be looked up for every search result
+_MAX_TITLE_LENGTH: int = Settings.MAX_TITLE_DISPLAY_LENGTH
+_MAX_SNIPPET_LENGTH: int = Settings.MAX_SNIPPET_DISPLAY_LENGTH
+
+# The same truncation rules as the ones of Jinja2's 'truncate' filter with its default arguments are used
+_TRUNCATION_LEEWAY: int = 5
+_TRUNCATION_END: str = "..."
+
+
 class SearchResult:
+    __slots__ = ("url", "title", "snippet", "score")
+
     def __init__(self, search_result_object: Dict[str, Any]):
+        title = str(search_result_object["title"])
+        if len(title) > _MAX_TITLE_LENGTH + _TRUNCATION_LEEWAY:
+            title = title[:_MAX_TITLE_LENGTH - len(_TRUNCATION_END)].rsplit(" ", 1)[0] + _TRUNCATION_END
+
+        snippet = str(search_result_object["snippet"])
+        if len(snippet) > _MAX_SNIPPET_LENGTH + _TRUNCATION_LEEWAY:
+            snippet = snippet[:_MAX_SNIPPET_LENGTH - len(_TRUNCATION_END)].rsplit(" ", 1)[0] + _TRUNCATION_END
+
         self.url: str = str(search_result_object["url"])
-        self.title: str = str(search_result_object["title"])
-        self.snippet: str = str(search_result_object["snippet"])
+        self.title: str = title
+        self.snippet: str = snippet
         self.score: float = float(search_result_object["score"])
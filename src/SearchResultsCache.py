@@ -0,0 +1,70 @@
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Copyright (c) 2021 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+
+
+from typing import List, Optional
+import collections
+import threading
+import time
+from SearchResult import SearchResult
+
+
+class SearchResultsCache:
+    # Thread-safe LRU cache whose entries expire after the specified time-to-live
+
+    def __init__(self, max_size: int, time_to_live: float):
+        self._max_size: int = max_size
+        self._time_to_live: float = time_to_live  # in seconds
+
+        self._entries: collections.OrderedDict = collections.OrderedDict()  # (query, max results, QBS) -> (expiration time, results)
+        self._lock: threading.Lock = threading.Lock()
+
+    def get(self, search_query: str, max_results: int, use_quotient_based_scoring: bool) -> Optional[List[SearchResult]]:
+        key = (search_query, max_results, use_quotient_based_scoring)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expiration_time, search_results = entry
+            if expiration_time <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+
+        return list(search_results)
+
+    def put(self, search_query: str, max_results: int, use_quotient_based_scoring: bool, search_results: List[SearchResult]) -> None:
+        if self._max_size <= 0:
+            return
+
+        key = (search_query, max_results, use_quotient_based_scoring)
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._time_to_live, tuple(search_results))
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
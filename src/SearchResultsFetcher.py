@@ -24,6 +24,8 @@ from typing import List
 import socket
 from Settings import Settings
 from SearchResult import SearchResult
+from SearchResultsCache import SearchResultsCache
+from SearchServerConnectionPool import SearchServerConnectionPool
 from SearchResultsFetcherException import SearchResultsFetcherException
 from msgess.msgess import MsgESS
 
@@ -32,23 +34,45 @@ class SearchResultsFetcher:
     _QUERY_MESSAGE_CLASS: int = 1
     _RESPONSE_MESSAGE_CLASS: int = 2
 
+    _results_cache: SearchResultsCache = SearchResultsCache(Settings.SEARCH_RESULTS_CACHE_SIZE, Settings.SEARCH_RESULTS_CACHE_TIME_TO_LIVE)
+    _connection_pool: SearchServerConnectionPool = SearchServerConnectionPool(Settings.SEARCH_SERVER_SOCKET_PATH, Settings.SEARCH_SERVER_CONNECTION_POOL_SIZE)
+
     def __init__(self, search_query: str, max_results: int, use_quotient_based_scoring: bool):
         self._search_query: str = search_query
         self._max_results: int = max_results
         self._use_quotient_based_scoring: bool = use_quotient_based_scoring
 
     def fetch_results_from_search_server(self) -> List[SearchResult]:
-        server_socket = None
+        # Very long queries are unlikely to be repeated, so they are not cached to prevent them from evicting useful entries;
+        #  the number of results is limited as well, so clients cannot make the cache hold on to huge result lists
+        use_cache = (len(self._search_query) <= Settings.SEARCH_RESULTS_CACHE_MAX_QUERY_LENGTH and
+                     self._max_results <= Settings.SEARCH_RESULTS_CACHE_MAX_RESULTS_PER_ENTRY)
 
-        try:
-            server_socket = self._connect_to_search_server()
+        if use_cache:
+            search_results = SearchResultsFetcher._results_cache.get(self._search_query, self._max_results, self._use_quotient_based_scoring)
+            if search_results is not None:
+                return search_results
 
-            server_msgess = MsgESS(server_socket)
-            server_msgess.set_compress_messages(False)
+        search_results = self._query_search_server()
 
-            self._send_query(server_msgess)
+        if use_cache and len(search_results) <= Settings.SEARCH_RESULTS_CACHE_MAX_RESULTS_PER_ENTRY:
+            SearchResultsFetcher._results_cache.put(self._search_query, self._max_results, self._use_quotient_based_scoring, search_results)
+
+        return search_results
+
+    def _query_search_server(self) -> List[SearchResult]:
+        try:
+            server_socket, is_reused_connection = SearchResultsFetcher._connection_pool.acquire()
+
+            if is_reused_connection:
+                try:
+                    return self._exchange_query_and_results(server_socket)
+                except (OSError, MsgESS.MsgESSException):
+                    # The server might have closed the idle connection right after it had been checked, so the query is
+                    #  retried once using a new connection
+                    server_socket = SearchResultsFetcher._connection_pool.acquire_new()
 
-            return self._receive_results(server_msgess)
+            return self._exchange_query_and_results(server_socket)
 
         except OSError:
             raise SearchResultsFetcherException("Failed to establish a connection to the search server!")
@@ -56,18 +80,25 @@ class SearchResultsFetcher:
         except MsgESS.MsgESSException:
             raise SearchResultsFetcherException("An error occurred while communicating with the search server!")
 
-        finally:
-            if server_socket:
-                try:
-                    server_socket.close()
-                except OSError:
-                    pass
+    def _exchange_query_and_results(self, server_socket: socket.socket) -> List[SearchResult]:
+        exchange_succeeded = False
 
-    def _connect_to_search_server(self) -> socket.socket:
-        server_sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-        server_sock.connect(Settings.SEARCH_SERVER_SOCKET_PATH)
+        try:
+            server_msgess = MsgESS(server_socket)
+            server_msgess.set_compress_messages(False)
 
-        return server_sock
+            self._send_query(server_msgess)
+            search_results = self._receive_results(server_msgess)
+
+            exchange_succeeded = True
+            return search_results
+
+        finally:
+            # The connection can be reused only if the whole query-response exchange has succeeded
+            if exchange_succeeded:
+                SearchResultsFetcher._connection_pool.release(server_socket)
+            else:
+                SearchResultsFetcher._connection_pool.discard(server_socket)
 
     def _send_query(self, server_msgess: MsgESS) -> None:
         server_msgess.send_json_object({
@@ -83,6 +114,6 @@ class SearchResultsFetcher:
             raise SearchResultsFetcherException("The app received an unexpected message from the search server!")
 
         try:
-            return [SearchResult(search_result_object) for search_result_object in received_json["search_results"]]
+            return list(map(SearchResult, received_json["search_results"]))
         except Exception:  # This will catch all the KeyErrors, ValueErrors, IndexErrors etc., that might occur
             raise SearchResultsFetcherException("The app received invalid data from the search server!")
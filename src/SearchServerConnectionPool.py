@@ -0,0 +1,94 @@
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Copyright (c) 2021 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+
+
+from typing import Tuple
+import queue
+import socket
+
+
+class SearchServerConnectionPool:
+    # Keeps idle connections to the search server open, so they can be reused by subsequent queries
+
+    def __init__(self, socket_path: str, max_idle_connections: int):
+        self._socket_path: str = socket_path
+        self._max_idle_connections: int = max_idle_connections
+
+        # queue.Queue is thread-safe; a maxsize of 0 would make it unbounded, so it's not created at all in that case
+        self._idle_connections: queue.Queue = queue.Queue(maxsize=max_idle_connections) if (max_idle_connections > 0) else None
+
+    def acquire(self) -> Tuple[socket.socket, bool]:
+        # Returns a connection and whether it was reused, i.e. whether the server might have closed it in the meantime
+        if self._idle_connections is not None:
+            while True:
+                try:
+                    server_socket = self._idle_connections.get_nowait()
+                except queue.Empty:
+                    break
+
+                if self._is_idle_connection_usable(server_socket):
+                    return server_socket, True
+
+                self.discard(server_socket)
+
+        return self.acquire_new(), False
+
+    def acquire_new(self) -> socket.socket:
+        server_sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+        try:
+            server_sock.connect(self._socket_path)
+        except OSError:
+            self.discard(server_sock)
+            raise
+
+        return server_sock
+
+    def release(self, server_socket: socket.socket) -> None:
+        if self._idle_connections is not None:
+            try:
+                self._idle_connections.put_nowait(server_socket)
+                return
+            except queue.Full:
+                pass
+
+        self.discard(server_socket)
+
+    @staticmethod
+    def discard(server_socket: socket.socket) -> None:
+        try:
+            server_socket.close()
+        except OSError:
+            pass
+
+    @staticmethod
+    def _is_idle_connection_usable(server_socket: socket.socket) -> bool:
+        # An idle connection must have nothing to read - an EOF means that the server has closed it in the meantime
+        try:
+            server_socket.recv(1, socket.MSG_PEEK | socket.MSG_DONTWAIT)
+        except BlockingIOError:
+            return True
+        except OSError:
+            return False
+
+        return False
@@ -24,11 +24,21 @@ class Settings:
     PROGRAM_VERSION: float = 1.3
 
     SEARCH_SERVER_SOCKET_PATH: str = "../../spideriment_search_server/src/working_dir/spideriment_search_server.sock"
+    # Idle connections are kept open for reuse only if the search server can process multiple queries per connection;
+    #  0 turns the pooling off and a new connection is then made for each query
+    SEARCH_SERVER_CONNECTION_POOL_SIZE: int = 0
 
     DEFAULT_MAX_RESULTS: int = 25
     DEFAULT_USE_QUOTIENT_BASED_SCORING: bool = True
 
+    SEARCH_RESULTS_CACHE_SIZE: int = 1024  # in entries; 0 turns the cache off
+    SEARCH_RESULTS_CACHE_TIME_TO_LIVE: float = 300.0  # in seconds
+    SEARCH_RESULTS_CACHE_MAX_QUERY_LENGTH: int = 256  # in characters
+    SEARCH_RESULTS_CACHE_MAX_RESULTS_PER_ENTRY: int = 100  # searches requesting more results are not cached
+
     MAX_TITLE_DISPLAY_LENGTH: int = 80
     MAX_SNIPPET_DISPLAY_LENGTH: int = 450
 
+    MAIN_PAGE_CACHE_MAX_AGE: int = 3600  # in seconds
+
     DEBUG: bool = False
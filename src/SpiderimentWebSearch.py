@@ -20,6 +20,7 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
+from typing import Optional
 import os.path
 import flask
 from Settings import Settings
@@ -31,6 +32,13 @@ os.chdir(os.path.dirname(os.path.realpath(__file__)))
 
 app = flask.Flask(__name__)
 
+# The default values are bound to module-level names, so they don't have to be looked up on every request
+_DEFAULT_MAX_RESULTS: int = Settings.DEFAULT_MAX_RESULTS
+_DEFAULT_USE_QUOTIENT_BASED_SCORING: bool = Settings.DEFAULT_USE_QUOTIENT_BASED_SCORING
+
+# The main page doesn't depend on the request in any way, so it's rendered only once
+_main_page_html: Optional[str] = None
+
 
 @app.context_processor
 def inject_settings_to_jinja2_templates() -> dict:
@@ -39,10 +47,19 @@ def inject_settings_to_jinja2_templates() -> dict:
 
 @app.route("/", methods=["GET"])
 def s_main_page():
-    return flask.render_template("index.html",
-                                 search_query="",
-                                 max_results=Settings.DEFAULT_MAX_RESULTS,
-                                 use_quotient_based_scoring=Settings.DEFAULT_USE_QUOTIENT_BASED_SCORING)
+    global _main_page_html
+
+    if _main_page_html is None or Settings.DEBUG:  # In debug mode, changes made to the templates are reflected immediately
+        _main_page_html = flask.render_template("index.html",
+                                                search_query="",
+                                                max_results=_DEFAULT_MAX_RESULTS,
+                                                use_quotient_based_scoring=_DEFAULT_USE_QUOTIENT_BASED_SCORING)
+
+    response = flask.Response(_main_page_html, mimetype="text/html")
+    response.cache_control.public = True
+    response.cache_control.max_age = Settings.MAIN_PAGE_CACHE_MAX_AGE
+
+    return response
 
 
 @app.route("/search", methods=["GET"])
@@ -54,7 +71,7 @@ def s_search():
 
     max_results = flask.request.args.get("max", default=-1, type=int)
     if max_results <= 0:
-        max_results = Settings.DEFAULT_MAX_RESULTS
+        max_results = _DEFAULT_MAX_RESULTS
 
     use_quotient_based_scoring = flask.request.args.get("qbs", default=False, type=bool)
 
@@ -22,14 +22,25 @@
 
 
 from __future__ import annotations
-from typing import Optional, Tuple, Union
+from typing import Optional, Tuple, Union, List
 import abc
-import gc
 import socket
+import ssl
+import struct
+import threading
 import json
-import gzip
 import zlib
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
 
 class MsgESS:
     """
@@ -73,6 +84,21 @@ class MsgESS:
     LIBRARY_VERSION: int = 6
     PROTOCOL_VERSION: int = 3
 
+    _HEADER_MAGIC_STRING: bytes = b"MsgESSbegin"
+    _FOOTER_MAGIC_STRING: bytes = b"MsgESSend"
+    _HEADER_STRUCT: struct.Struct = struct.Struct(">11siiibb")
+    _HEADER_LENGTH: int = _HEADER_STRUCT.size
+    _FOOTER_LENGTH: int = len(_FOOTER_MAGIC_STRING)
+    _COMPRESSION_LEVEL: int = 6
+    _COMPRESSION_WBITS: int = 16 + zlib.MAX_WBITS  # The gzip container format is used on the wire
+    _DECOMPRESSION_CHUNK_SIZE: int = 262144  # Larger compressed message bodies are decompressed while being received
+
+    # Unlike the json module, orjson refuses to serialize dictionaries with non-string keys unless it's told otherwise
+    _ORJSON_SERIALIZATION_OPTIONS: int = (orjson.OPT_NON_STR_KEYS if (orjson is not None) else 0)
+
+    # Each thread gets its own simdjson parser, which is created on first use and then reused for all its parse() calls
+    _simdjson_parser_storage: threading.local = threading.local()
+
     def __init__(self, socket_: Union[socket.socket, StreamSocketLikeObject]):
         """Initializes a new MsgESS instance.
 
@@ -125,30 +151,28 @@ class MsgESS:
 
         # compress message, if requested
         if self._compress_messages:
-            binary_data = gzip.compress(binary_data)
-            gc.collect()
-
-        binary_data_length = len(binary_data)
-
-        # assemble message:
-        #  message header = magic string (11b), protocol version (4b), raw bytes length (4b), user-defined message class (4b),
-        #   is message compressed? (1b), data type (1b) -> 25 bytes in total
-        #  message footer = magic string (9b) -> 9 bytes in total
-        message = b"MsgESSbegin"
-        message += self.PROTOCOL_VERSION.to_bytes(4, byteorder="big", signed=True)
-        message += binary_data_length.to_bytes(4, byteorder="big", signed=True)
-        message += message_class.to_bytes(4, byteorder="big", signed=True)
-        message += self._compress_messages.to_bytes(1, byteorder="big", signed=True)
-        message += _data_type.to_bytes(1, byteorder="big", signed=True)
-        message += binary_data
-        message += b"MsgESSend"
-
-        binary_data = None
-        gc.collect()
-
-        # send message
+            compressor = zlib.compressobj(self._COMPRESSION_LEVEL, zlib.DEFLATED, self._COMPRESSION_WBITS)
+            binary_data = compressor.compress(binary_data) + compressor.flush()
+
+        # assemble message header:
+        #  magic string (11b), protocol version (4b), raw bytes length (4b), user-defined message class (4b),
+        #  is message compressed? (1b), data type (1b) -> 25 bytes in total
+        # the message footer is a magic string (9b) -> 9 bytes in total
+        try:
+            header = self._HEADER_STRUCT.pack(self._HEADER_MAGIC_STRING, self.PROTOCOL_VERSION, len(binary_data), message_class, self._compress_messages, _data_type)
+        except struct.error as e:
+            raise MsgESS.MsgESSException("Failed to assemble the message header!", e)
+
+        # send message - the header, body and footer are sent separately, so a potentially large body doesn't have to be
+        #  copied into a new bytes object together with them
         try:
-            self._socket.sendall(message)
+            # ssl.SSLSocket is a subclass of socket.socket, but its sendmsg() method always raises NotImplementedError
+            if isinstance(self._socket, socket.socket) and not isinstance(self._socket, ssl.SSLSocket) and hasattr(self._socket, "sendmsg"):
+                self._send_buffers_to_socket([header, binary_data, self._FOOTER_MAGIC_STRING])
+            else:
+                self._socket.sendall(header)
+                self._socket.sendall(binary_data)
+                self._socket.sendall(self._FOOTER_MAGIC_STRING)
         except OSError as e:
             raise MsgESS.MsgESSException("Failed to send the message to the socket!", e)
 
@@ -161,41 +185,41 @@ class MsgESS:
         """
 
         # receive, parse and check message header (see self.send_binary_data for header items and their lengths)
-        header = self._receive_n_bytes_from_socket(25)
-        if header[0:11] != b"MsgESSbegin":
+        header = self._receive_n_bytes_from_socket(self._HEADER_LENGTH)
+        magic_string, protocol_version, message_length, message_class, is_message_compressed, data_type = self._HEADER_STRUCT.unpack(header)
+
+        if magic_string != self._HEADER_MAGIC_STRING:
             raise MsgESS.MsgESSException("The received message has an invalid magic header string!")
 
-        if int.from_bytes(header[11:15], byteorder="big", signed=True) != self.PROTOCOL_VERSION:
+        if protocol_version != self.PROTOCOL_VERSION:
             raise MsgESS.MsgESSException("The remote host uses an incompatible protocol version!")
 
-        message_length = int.from_bytes(header[15:19], byteorder="big", signed=True)
         if message_length < 0:
             raise MsgESS.MsgESSException("The received message's length is invalid!")
         if message_length > self._max_message_size:
             raise MsgESS.MsgESSException("The received message is too big!")
 
-        message_class = int.from_bytes(header[19:23], byteorder="big", signed=True)
         if message_class < 0:
             raise MsgESS.MsgESSException("The received message's class is invalid!")
 
-        is_message_compressed = bool.from_bytes(header[23:24], byteorder="big", signed=True)
-
         # check the data type
-        if int.from_bytes(header[24:25], byteorder="big", signed=True) != _data_type:
+        if data_type != _data_type:
             raise MsgESS.MsgESSException("The received message has an invalid data type!")
 
-        # receive and possibly decompress message body
-        message = self._receive_n_bytes_from_socket(message_length)
-        if is_message_compressed:
+        # receive and possibly decompress message body (the received buffer has to be copied only if it's returned as-is)
+        if is_message_compressed and message_length > self._DECOMPRESSION_CHUNK_SIZE:
+            message = self._receive_and_decompress_n_bytes_from_socket(message_length)
+        elif is_message_compressed:
             try:
-                message = gzip.decompress(message)
-            except (OSError, EOFError, zlib.error) as e:
+                message = zlib.decompress(self._receive_n_bytes_from_socket(message_length), self._COMPRESSION_WBITS)
+            except zlib.error as e:
                 raise MsgESS.MsgESSException("Failed to decompress the received message's body!", e)
-            gc.collect()
+        else:
+            message = bytes(self._receive_n_bytes_from_socket(message_length))
 
         # receive and check message footer
-        footer = self._receive_n_bytes_from_socket(9)
-        if footer != b"MsgESSend":
+        footer = self._receive_n_bytes_from_socket(self._FOOTER_LENGTH)
+        if footer != self._FOOTER_MAGIC_STRING:
             raise MsgESS.MsgESSException("The received message has an invalid magic footer string!")
 
         return message, message_class
@@ -237,6 +261,9 @@ class MsgESS:
     def send_json_array(self, json_array: list, message_class: int) -> None:
         """Send a message with a serialized JSON array in its body to the socket.
 
+        Non-finite floats (NaN, Infinity and -Infinity) are sent as null if orjson is installed, since they cannot be
+        represented in standard JSON; otherwise, the json module's non-standard NaN and Infinity tokens are sent.
+
         :param json_array: The JSON array to serialize and send.
         :param message_class: User-defined message class that can be used for multiplexing.
         :raises: MsgESS.MsgESSException: If any error is encountered during the sending process.
@@ -246,11 +273,11 @@ class MsgESS:
             raise MsgESS.MsgESSException("The data sent must be of the 'list' type!")
 
         try:
-            message = json.dumps(json_array)
-        except TypeError as e:
+            message = self._serialize_json(json_array)
+        except (TypeError, ValueError) as e:
             raise MsgESS.MsgESSException("Failed to serialize the supplied list to JSON array!", e)
 
-        self.send_string(message, message_class, _data_type=self._MessageDataType.JSON_ARRAY)
+        self.send_binary_data(message, message_class, _data_type=self._MessageDataType.JSON_ARRAY)
 
     def receive_json_array(self) -> Tuple[list, int]:
         """
@@ -260,11 +287,11 @@ class MsgESS:
         :raises: MsgESS.MsgESSException: If any error is encountered during the receiving process.
         """
 
-        message, message_class = self.receive_string(_data_type=self._MessageDataType.JSON_ARRAY)
+        message, message_class = self.receive_binary_data(_data_type=self._MessageDataType.JSON_ARRAY)
 
         try:
-            deserialized_json = json.loads(message)
-        except json.JSONDecodeError as e:
+            deserialized_json = self._deserialize_json(message)
+        except ValueError as e:
             raise MsgESS.MsgESSException("Failed to decode the received JSON array!", e)
 
         if not isinstance(deserialized_json, list):
@@ -275,6 +302,9 @@ class MsgESS:
     def send_json_object(self, json_object: dict, message_class: int) -> None:
         """Send a message with a serialized JSON object in its body to the socket.
 
+        Non-finite floats (NaN, Infinity and -Infinity) are sent as null if orjson is installed, since they cannot be
+        represented in standard JSON; otherwise, the json module's non-standard NaN and Infinity tokens are sent.
+
         :param json_object: The JSON object to serialize and send.
         :param message_class: User-defined message class that can be used for multiplexing.
         :raises: MsgESS.MsgESSException: If any error is encountered during the sending process.
@@ -284,11 +314,11 @@ class MsgESS:
             raise MsgESS.MsgESSException("The data sent must be of the 'dict' type!")
 
         try:
-            message = json.dumps(json_object)
-        except TypeError as e:
+            message = self._serialize_json(json_object)
+        except (TypeError, ValueError) as e:
             raise MsgESS.MsgESSException("Failed to serialize the supplied list to JSON array!", e)
 
-        self.send_string(message, message_class, _data_type=self._MessageDataType.JSON_OBJECT)
+        self.send_binary_data(message, message_class, _data_type=self._MessageDataType.JSON_OBJECT)
 
     def receive_json_object(self) -> Tuple[dict, int]:
         """
@@ -298,11 +328,11 @@ class MsgESS:
         :raises: MsgESS.MsgESSException: If any error is encountered during the receiving process.
         """
 
-        message, message_class = self.receive_string(_data_type=self._MessageDataType.JSON_OBJECT)
+        message, message_class = self.receive_binary_data(_data_type=self._MessageDataType.JSON_OBJECT)
 
         try:
-            deserialized_json = json.loads(message)
-        except json.JSONDecodeError as e:
+            deserialized_json = self._deserialize_json(message)
+        except ValueError as e:
             raise MsgESS.MsgESSException("Failed to decode the received JSON object!", e)
 
         if not isinstance(deserialized_json, dict):
@@ -310,13 +340,116 @@ class MsgESS:
 
         return deserialized_json, message_class
 
-    def _receive_n_bytes_from_socket(self, n: int) -> bytes:
+    @staticmethod
+    def _serialize_json(json_data: Union[list, dict]) -> bytes:
+        # orjson serializes directly to UTF-8 encoded bytes and is several times faster than the json module
+        if orjson is not None:
+            try:
+                return orjson.dumps(json_data, option=MsgESS._ORJSON_SERIALIZATION_OPTIONS)
+            except TypeError:
+                pass  # orjson refuses some data the json module accepts (e.g. integers wider than 64 bits), so it's tried too
+
+        return json.dumps(json_data).encode("utf-8")
+
+    @staticmethod
+    def _deserialize_json(message: bytes) -> Union[list, dict]:
+        # orjson's and json's decode errors (including invalid UTF-8 characters) are subclasses of ValueError; simdjson
+        #  raises ValueError for malformed documents, but RuntimeError for valid JSON it cannot represent, e.g. integers
+        #  wider than 64 bits (BIGINT_ERROR) or too deeply nested documents (DEPTH_ERROR) - checked with pysimdjson 7.0.2
+        try:
+            if simdjson is not None:
+                # The document is converted to Python objects right away, as the lazy proxy objects would be invalidated
+                #  by the next parse() call made with the same parser
+                return MsgESS._get_simdjson_parser().parse(message, True)
+
+            if orjson is not None:
+                return orjson.loads(message)
+        except (ValueError, RuntimeError):
+            # simdjson and orjson accept only strict JSON, but peers using the json module send the non-standard NaN and
+            #  Infinity tokens by default (and possibly integers wider than 64 bits), so the json module is tried too
+            pass
+
+        return json.loads(message.decode("utf-8"))
+
+    @staticmethod
+    def _get_simdjson_parser() -> simdjson.Parser:
+        # A simdjson parser reuses its internal buffers across parse() calls, but it must not be shared between threads
+        parser = getattr(MsgESS._simdjson_parser_storage, "parser", None)
+        if parser is None:
+            parser = simdjson.Parser()
+            MsgESS._simdjson_parser_storage.parser = parser
+
+        return parser
+
+    def _send_buffers_to_socket(self, buffers: List[bytes]) -> None:
+        # Scatter-gather I/O - the OS gathers the data from all the buffers at once, so they are sent using a single system
+        #  call in most cases; since sendmsg() might send only a part of the data, the loop continues with the rest
+        buffer_views = [memoryview(buffer) for buffer in buffers if buffer]
+
+        while buffer_views:
+            bytes_sent = self._socket.sendmsg(buffer_views)
+
+            while buffer_views and bytes_sent >= len(buffer_views[0]):
+                bytes_sent -= len(buffer_views.pop(0))
+
+            if bytes_sent > 0:
+                buffer_views[0] = buffer_views[0][bytes_sent:]
+
+    def _receive_n_bytes_from_socket(self, n: int) -> bytearray:
+        # Stream-socket-like objects are only required to implement recv(), so they cannot receive into a buffer
+        if not isinstance(self._socket, socket.socket):
+            return self._receive_n_bytes_from_socket_like_object(n)
+
+        # The data are received directly into a preallocated buffer, so they don't have to be copied over and over again
+        data = bytearray(n)
+        data_view = memoryview(data)
+        bytes_received = 0
+
+        while bytes_received < n:
+            try:
+                current_length = self._socket.recv_into(data_view[bytes_received:], min(65536, n - bytes_received))
+            except OSError as e:
+                raise MsgESS.MsgESSException("Failed to receive data from the socket!", e)
+
+            if current_length == 0:
+                raise MsgESS.MsgESSException("The recv() call has succeeded, but no data were received - the connection is probably dead.")
+
+            bytes_received += current_length
+
+        if n != bytes_received:
+            raise RuntimeError("The OS has received a different number of bytes than it was requested!")
+
+        return data
+
+    def _receive_and_decompress_n_bytes_from_socket(self, n: int) -> bytes:
+        # The data are decompressed chunk by chunk as they arrive, so the decompression overlaps with the receiving and
+        #  the whole compressed message body doesn't have to be held in memory
+        decompressor = zlib.decompressobj(self._COMPRESSION_WBITS)
+        decompressed_chunks = []
+        bytes_left = n
+
+        try:
+            while bytes_left > 0:
+                compressed_chunk = self._receive_n_bytes_from_socket(min(self._DECOMPRESSION_CHUNK_SIZE, bytes_left))
+                decompressed_chunks.append(decompressor.decompress(compressed_chunk))
+                bytes_left -= len(compressed_chunk)
+
+            decompressed_chunks.append(decompressor.flush())
+        except zlib.error as e:
+            raise MsgESS.MsgESSException("Failed to decompress the received message's body!", e)
+
+        if not decompressor.eof:
+            raise MsgESS.MsgESSException("Failed to decompress the received message's body - it's truncated!")
+
+        return b"".join(decompressed_chunks)
+
+    def _receive_n_bytes_from_socket_like_object(self, n: int) -> bytearray:
         bytes_left = n
-        data = bytes()
+        data = bytearray()
 
         while bytes_left > 0:
             try:
-                current_data = self._socket.recv(min(16384, bytes_left))
+                current_data = self._socket.recv(min(65536, bytes_left))
             except OSError as e:
                 raise MsgESS.MsgESSException("Failed to receive data from the socket!", e)
 
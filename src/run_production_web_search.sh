@@ -0,0 +1,38 @@
+#!/bin/bash
+
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Copyright (c) 2021 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+
+function exit_with_error() {
+  echo "ERROR: $1"
+  exit 1
+}
+
+
+
+# Traverse to the directory where this script is located
+cd -- "$(dirname -- "$0")" || exit_with_error "Failed to traverse into the script's directory"
+
+# Run the program using the Gunicorn WSGI server - each CPU core gets a worker process with a small pool of threads, which
+#  hide the latency of waiting for the search server; the app should be put behind a reverse proxy web server
+./virtualenv/bin/gunicorn --workers "$(nproc)" --worker-class gthread --threads 8 --bind 127.0.0.1:8000 wsgi:application